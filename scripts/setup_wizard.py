@@ -8,9 +8,17 @@ from getpass import getpass
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Constants
 CONFIG_DIR = "config"
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.yaml")
+CONFIG_TMP_FILE = CONFIG_FILE + ".tmp"
 CONFIG_TEMPLATE = os.path.join(CONFIG_DIR, "config.yaml.basic")
 MOSQUITTO_PASSWD_FILE = "deploy/passwd"  # nosec B105
 
@@ -94,7 +102,7 @@ def main() -> None:
 
     # Load configuration
     with open(CONFIG_FILE, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)  # nosec B506
 
     # Interactive prompts
     print("\nPlease provide the following information:")
@@ -158,9 +166,24 @@ def main() -> None:
     mqtt_pass = config.get("mqtt", {}).get("password", "")
     config["mqtt"]["password"] = getpass("MQTT Password: ") or mqtt_pass
 
-    # Save configuration
-    with open(CONFIG_FILE, "w") as f:
-        yaml.dump(config, f, sort_keys=False)
+    # Save configuration atomically so an interrupted write never leaves a
+    # truncated config.yaml behind.
+    # The file holds the MQTT password, so it is created owner-only rather
+    # than with umask permissions; a stale temp file from an earlier crash is
+    # removed first so O_EXCL guarantees the mode.
+    if os.path.exists(CONFIG_TMP_FILE):
+        os.remove(CONFIG_TMP_FILE)
+    try:
+        fd = os.open(CONFIG_TMP_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            yaml.dump(config, f, Dumper=_YamlDumper, sort_keys=False, encoding="utf-8")
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(CONFIG_FILE, CONFIG_TMP_FILE)
+        os.replace(CONFIG_TMP_FILE, CONFIG_FILE)
+    finally:
+        if os.path.exists(CONFIG_TMP_FILE):
+            os.remove(CONFIG_TMP_FILE)
     print(f"\nConfiguration saved to '{CONFIG_FILE}'.")
 
     # Mosquitto password file
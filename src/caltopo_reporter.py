@@ -7,13 +7,21 @@ import logging
 import os
 import random
 import re
-from typing import Any, Optional, cast
+from typing import Any, Dict, Optional, cast
 from urllib.parse import urlencode, urlparse
 
 import httpx
 
 from utils import sanitize_for_log
 
+# Connection pool settings for CalTopo clients. Position reports for a node
+# typically arrive tens of seconds apart, well past httpx's 5 s default idle
+# expiry, so keep connections long enough to skip a new TLS handshake per
+# report.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+
 
 def _matches_url_pattern(url: str, pattern: str) -> bool:
     """
@@ -116,10 +124,13 @@ class CalTopoReporter:
         # Pre-compile the identifier validation regex
         self._identifier_regex = re.compile(r"^[a-zA-Z0-9_-]+$")
 
+        # Endpoint URLs for identifiers that already passed validation
+        self._endpoint_urls: Dict[str, str] = {}
+
     async def start(self) -> None:
         """Initialize the persistent HTTP client."""
         if self.client is None:
-            self.client = httpx.AsyncClient(timeout=self.timeout)
+            self.client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_LIMITS)
             self._owns_client = True
 
     def _is_valid_caltopo_identifier(self, identifier: str) -> bool:
@@ -154,6 +165,28 @@ class CalTopoReporter:
             return False
         return True
 
+    def _endpoint_url(self, identifier: str, identifier_type: str) -> Optional[str]:
+        """
+        Return the endpoint URL for a connect_key or group.
+
+        The identifier is validated the first time it is seen and the resulting
+        URL is reused afterwards, so repeated reports for the same key skip the
+        regex check and string building.
+
+        Args:
+            identifier: The connect_key or group
+            identifier_type: The type of identifier for error logging
+
+        Returns:
+            Optional[str]: The endpoint URL, or None if the identifier is invalid
+        """
+        url = self._endpoint_urls.get(identifier)
+        if url is None:
+            if not self._validate_and_log_identifier(identifier, identifier_type):
+                return None
+            url = self._endpoint_urls[identifier] = f"{self.BASE_URL}/{identifier}"
+        return url
+
     def _redact_secrets(self, text: str) -> str:
         """
         Redact sensitive information (connect_key/group) from text.
@@ -247,11 +280,10 @@ class CalTopoReporter:
         """
         # Safety check: ensure the key doesn't contain malicious characters
         # for URL construction.
-        if not self._validate_and_log_identifier(connect_key, "connect_key"):
+        url = self._endpoint_url(connect_key, "connect_key")
+        if url is None:
             return False
 
-        # Construct specific endpoint URL
-        url = f"{self.BASE_URL}/{connect_key}"
         params = {"id": callsign, "lat": latitude, "lng": longitude}
         query_string = urlencode(params)
         full_url = f"{url}?{query_string}"
@@ -269,10 +301,10 @@ class CalTopoReporter:
         """
         Internal method to send position data to a team 'group' endpoint.
         """
-        if not self._validate_and_log_identifier(group, "group"):
+        url = self._endpoint_url(group, "group")
+        if url is None:
             return False
 
-        url = f"{self.BASE_URL}/{group}"
         params = {"id": callsign, "lat": latitude, "lng": longitude}
         query_string = urlencode(params)
         full_url = f"{url}?{query_string}"
@@ -308,15 +340,16 @@ class CalTopoReporter:
         max_retries = 3
         base_delay = 1.0  # seconds
 
-        # Consistently redact sensitive path parameters for both endpoint types.
-        log_url = self._redact_secrets(url)
-
         for attempt in range(max_retries + 1):
             try:
-                self.logger.debug(
-                    f"Sending position update for {sanitize_for_log(callsign)} "
-                    f"to {endpoint_type} (attempt {attempt + 1}): {log_url}"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # Consistently redact sensitive path parameters for both
+                    # endpoint types.
+                    log_url = self._redact_secrets(url)
+                    self.logger.debug(
+                        f"Sending position update for {sanitize_for_log(callsign)} "
+                        f"to {endpoint_type} (attempt {attempt + 1}): {log_url}"
+                    )
 
                 response = await client.get(url)
 
@@ -11,14 +11,12 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 import pydantic
-from aiohttp import web
 
-from caltopo_reporter import CalTopoReporter
+from caltopo_reporter import HTTP_LIMITS, CalTopoReporter
 from config.config import Config
 from mqtt_client import MqttClient
 from persistent_dict import PersistentDict
 from utils import sanitize_for_log
-from web import create_app
 
 
 class GatewayApp:
@@ -240,7 +238,7 @@ class GatewayApp:
                 self.config.mqtt.broker = "mosquitto"
 
             # Initialize Shared HTTP Client
-            self.http_client = httpx.AsyncClient(timeout=10)
+            self.http_client = httpx.AsyncClient(timeout=10, limits=HTTP_LIMITS)
 
             # Initialize CalTopo reporter with shared client
             self.logger.info("Initializing CalTopo reporter...")
@@ -309,6 +307,12 @@ class GatewayApp:
             web_runner = None
             if self.config and self.config.web and self.config.web.enabled:
                 self.logger.info(f"Starting Web UI on port {self.config.web.port}...")
+                # Imported here so the aiohttp/jinja2/session stack is only
+                # loaded when the Web UI is actually enabled.
+                from aiohttp import web
+
+                from web import create_app
+
                 web_app = await create_app(self)
                 web_runner = web.AppRunner(web_app)
                 await web_runner.setup()
@@ -475,17 +479,19 @@ class GatewayApp:
             elif message_type == "traceroute":
                 self._process_traceroute_message(data, numeric_node_id)
             elif message_type == "":
-                self.logger.debug(
-                    f"Received message with empty type from "
-                    f"{sanitize_for_log(numeric_node_id)}, skipping"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Received message with empty type from "
+                        f"{sanitize_for_log(numeric_node_id)}, skipping"
+                    )
                 return
             else:
-                self.logger.debug(
-                    f"Received unsupported message type from "
-                    f"{sanitize_for_log(numeric_node_id)}: "
-                    f"{sanitize_for_log(message_type)}"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Received unsupported message type from "
+                        f"{sanitize_for_log(numeric_node_id)}: "
+                        f"{sanitize_for_log(message_type)}"
+                    )
                 return
 
             self.stats["messages_processed"] += 1
@@ -521,11 +527,12 @@ class GatewayApp:
             # Configuration is the source of truth.
             # This prevents stale config from persisting if removed from
             # config.yaml.
-            self.logger.debug(
-                f"Using configured device_id as callsign: "
-                f"{sanitize_for_log(hardware_id)} -> "
-                f"{sanitize_for_log(configured_device_id)}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Using configured device_id as callsign: "
+                    f"{sanitize_for_log(hardware_id)} -> "
+                    f"{sanitize_for_log(configured_device_id)}"
+                )
             return configured_device_id
 
         # Check cache SECOND (for learned/discovered nodes)
@@ -648,15 +655,15 @@ class GatewayApp:
 
         # Get the hardware ID for this numeric node ID
         # We don't persist it yet, waiting for authorization
-        hardware_id = self._resolve_hardware_id(str(numeric_node_id))
-        is_new_mapping = str(numeric_node_id) not in self._node_id_cache
+        node_id_str = str(numeric_node_id)
+        hardware_id = self._resolve_hardware_id(node_id_str)
+        is_new_mapping = node_id_str not in self._node_id_cache
 
         # Update device state (last seen)
-        if hardware_id not in self.device_states:
-            self.device_states[hardware_id] = {}
-        self.device_states[hardware_id]["last_seen"] = time.time()
-        self.device_states[hardware_id]["latitude"] = latitude
-        self.device_states[hardware_id]["longitude"] = longitude
+        state = self.device_states.setdefault(hardware_id, {})
+        state["last_seen"] = time.time()
+        state["latitude"] = latitude
+        state["longitude"] = longitude
 
         if is_new_mapping and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
@@ -693,7 +700,6 @@ class GatewayApp:
                         connect_key=connect_key,
                     )
                     if success:
-                        state = self.device_states.setdefault(hardware_id, {})
                         state["position_updates_sent"] = (
                             state.get("position_updates_sent", 0) + 1
                         )
@@ -733,28 +739,28 @@ class GatewayApp:
                                 )
                                 if success:
                                     sent_any = True
-                                    state = self.device_states.setdefault(
-                                        hardware_id, {}
-                                    )
                                     state["position_updates_sent"] = (
                                         state.get("position_updates_sent", 0) + 1
                                     )
                                     self.stats["position_updates_sent"] += 1
                     if not sent_any:
                         self.logger.debug(
-                            f"Device {hardware_id} is unmapped and no tenants "
-                            "are configured to receive broadcasted positions."
+                            "Device %s is unmapped and no tenants "
+                            "are configured to receive broadcasted positions.",
+                            hardware_id,
                         )
                 else:
                     if is_mapped:
                         self.logger.debug(
-                            f"Device {hardware_id} dropped: matched a tenant, but no "
-                            "position update was successful (check CalTopo config)."
+                            "Device %s dropped: matched a tenant, but no "
+                            "position update was successful (check CalTopo config).",
+                            hardware_id,
                         )
                     else:
                         self.logger.debug(
-                            f"Device {hardware_id} dropped: multi-tenant mode active "
-                            f"and device not mapped by any tenant."
+                            "Device %s dropped: multi-tenant mode active "
+                            "and device not mapped by any tenant.",
+                            hardware_id,
                         )
             return
 
@@ -783,7 +789,6 @@ class GatewayApp:
         )
 
         if success:
-            state = self.device_states.setdefault(hardware_id, {})
             state["position_updates_sent"] = state.get("position_updates_sent", 0) + 1
             self.stats["position_updates_sent"] += 1
         else:
@@ -834,10 +839,11 @@ class GatewayApp:
                 "role": role,
             }
             state.update({k: v for k, v in updates.items() if v})
-            self.logger.debug(
-                f"Mapped numeric node ID {sanitize_for_log(numeric_node_id)} "
-                f"to hardware ID {sanitize_for_log(node_id_from_payload)}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Mapped numeric node ID {sanitize_for_log(numeric_node_id)} "
+                    f"to hardware ID {sanitize_for_log(node_id_from_payload)}"
+                )
 
             # Extract and store callsign - prioritize configured device_id over
             # Meshtastic longname
@@ -848,28 +854,31 @@ class GatewayApp:
             if configured_device_id:
                 # We do NOT write this to the database anymore.
                 # Configuration is the source of truth.
-                self.logger.debug(
-                    f"Hardware ID {sanitize_for_log(node_id_from_payload)} "
-                    f"is in configuration, skipping persistent callsign mapping."
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Hardware ID {sanitize_for_log(node_id_from_payload)} "
+                        f"is in configuration, skipping persistent callsign mapping."
+                    )
             elif longname:
                 # Fallback to Meshtastic longname if no configured device_id
                 self._persist_callsign_mapping(node_id_from_payload, longname)
-                self.logger.debug(
-                    f"Mapped hardware ID "
-                    f"{sanitize_for_log(node_id_from_payload)} "
-                    f"to callsign {sanitize_for_log(longname)} "
-                    f"(from longname)"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Mapped hardware ID "
+                        f"{sanitize_for_log(node_id_from_payload)} "
+                        f"to callsign {sanitize_for_log(longname)} "
+                        f"(from longname)"
+                    )
             elif shortname:
                 # Final fallback to shortname if longname not available
                 self._persist_callsign_mapping(node_id_from_payload, shortname)
-                self.logger.debug(
-                    f"Mapped hardware ID "
-                    f"{sanitize_for_log(node_id_from_payload)} "
-                    f"to callsign {sanitize_for_log(shortname)} "
-                    f"(from shortname)"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Mapped hardware ID "
+                        f"{sanitize_for_log(node_id_from_payload)} "
+                        f"to callsign {sanitize_for_log(shortname)} "
+                        f"(from shortname)"
+                    )
 
         self.logger.info(
             f"Node info from {sanitize_for_log(numeric_node_id)}: "
@@ -905,17 +914,16 @@ class GatewayApp:
         channel_utilization = payload.get("channel_utilization")
 
         hardware_id = self._resolve_hardware_id(str(numeric_node_id))
-        if hardware_id not in self.device_states:
-            self.device_states[hardware_id] = {}
-        self.device_states[hardware_id]["last_seen"] = time.time()
+        state = self.device_states.setdefault(hardware_id, {})
+        state["last_seen"] = time.time()
         if battery_level is not None:
-            self.device_states[hardware_id]["battery_level"] = battery_level
+            state["battery_level"] = battery_level
         if voltage is not None:
-            self.device_states[hardware_id]["voltage"] = round(float(voltage), 2)
+            state["voltage"] = round(float(voltage), 2)
         if uptime_seconds is not None:
-            self.device_states[hardware_id]["uptime_seconds"] = uptime_seconds
+            state["uptime_seconds"] = uptime_seconds
         if channel_utilization is not None:
-            self.device_states[hardware_id]["channel_utilization"] = channel_utilization
+            state["channel_utilization"] = channel_utilization
 
         self.logger.info(
             f"Telemetry from {sanitize_for_log(numeric_node_id)}: "
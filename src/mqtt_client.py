@@ -100,10 +100,11 @@ class MqttClient:
         """
         try:
             payload = message.payload.decode("utf-8")
-            self.logger.debug(
-                f"Received message on topic {sanitize_for_log(message.topic)}: "
-                f"{sanitize_for_log(payload)}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Received message on topic {sanitize_for_log(message.topic)}: "
+                    f"{sanitize_for_log(payload)}"
+                )
 
             # Parse JSON
             data = json.loads(payload)
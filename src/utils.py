@@ -2,7 +2,31 @@
 Utility functions for the MeshTopo gateway service.
 """
 
-from typing import Any
+from typing import Any, Dict
+
+
+def _escape_codepoint(codepoint: int) -> str:
+    """Return the code point's character, or a \\x escape if non-printable."""
+    char = chr(codepoint)
+    return char if char.isprintable() else f"\\x{codepoint:02x}"
+
+
+class _EscapeTable(Dict[int, str]):
+    """
+    str.translate() table mapping non-printable code points to \\x escapes.
+
+    Latin-1 is precomputed. Other code points are classified on each lookup
+    without being stored, since log text can come from untrusted MQTT
+    payloads and a cache would grow with every distinct character sent.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        return _escape_codepoint(codepoint)
+
+
+_ESCAPE_TABLE = _EscapeTable(
+    {codepoint: _escape_codepoint(codepoint) for codepoint in range(256)}
+)
 
 
 def sanitize_for_log(text: Any) -> str:
@@ -18,6 +42,10 @@ def sanitize_for_log(text: Any) -> str:
     if text is None:
         return "None"
 
-    # Convert to string and replace non-printable characters
     s = str(text)
-    return "".join(c if c.isprintable() else f"\\x{ord(c):02x}" for c in s)
+    # Most log values are already clean; a single C-level scan confirms it
+    if s.isprintable():
+        return s
+
+    # Escape non-printable characters in a single C loop
+    return s.translate(_ESCAPE_TABLE)
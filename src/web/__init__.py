@@ -1,20 +1,52 @@
 """Web UI module for Gateway Configuration."""
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 import aiohttp_jinja2
 import jinja2
 from aiohttp import web
+from jinja2.bccache import Bucket
 
 from .auth import setup_auth
 from .keys import GATEWAY_APP_KEY
+from .middlewares import compression_middleware
 from .routes import setup_routes
 
 if TYPE_CHECKING:
     from gateway_app import GatewayApp
 
 
+class _MemoryBytecodeCache(jinja2.BytecodeCache):
+    """In-process Jinja2 bytecode cache that outlives individual apps.
+
+    Saving the config restarts the gateway inside the same process, which builds
+    a fresh Jinja2 environment. Sharing compiled template code across those
+    environments spares every restart from parsing and compiling the templates
+    again. Jinja2 checks each entry against the template source before use.
+    """
+
+    def __init__(self) -> None:
+        self._store: Dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Fill the bucket from the cache if an entry exists."""
+        data = self._store.get(bucket.key)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store the bucket's compiled code."""
+        self._store[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._store.clear()
+
+
+_bytecode_cache = _MemoryBytecodeCache()
+
+
 async def create_app(gateway_app: "GatewayApp") -> web.Application:
     """Create and configure the aiohttp web application.
 
@@ -24,14 +56,18 @@ async def create_app(gateway_app: "GatewayApp") -> web.Application:
     Returns:
         The configured aiohttp web application.
     """
-    app = web.Application()
+    app = web.Application(middlewares=[compression_middleware])
 
     # Attach gateway_app so handlers can access it using strict AppKey
     app[GATEWAY_APP_KEY] = gateway_app
 
     # Setup Jinja2 templates
     template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
-    aiohttp_jinja2.setup(app, loader=jinja2.FileSystemLoader(template_dir))
+    aiohttp_jinja2.setup(
+        app,
+        loader=jinja2.FileSystemLoader(template_dir),
+        bytecode_cache=_bytecode_cache,
+    )
 
     # Setup session and auth
     setup_auth(app, gateway_app)
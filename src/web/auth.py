@@ -1,12 +1,13 @@
 """Authentication utilities for the Web UI."""
 
+import asyncio
 import base64
 import binascii
 import hashlib
 import os
 import secrets
 from functools import wraps
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Optional
 
 import aiohttp_session
 import bcrypt
@@ -14,6 +15,18 @@ from aiohttp import web
 from aiohttp_session import get_session
 from aiohttp_session.cookie_storage import EncryptedCookieStorage
 
+# Session key generated when none is configured or persisted, shared by every
+# app created in this process.
+_fallback_session_key: Optional[bytes] = None
+
+
+def _get_fallback_session_key() -> bytes:
+    """Return the process-wide fallback session key, generating it on first use."""
+    global _fallback_session_key
+    if _fallback_session_key is None:
+        _fallback_session_key = os.urandom(32)
+    return _fallback_session_key
+
 
 def setup_auth(app: web.Application, gateway_app: Any = None) -> None:
     """Setup session and authentication parameters for the app."""
@@ -34,11 +47,11 @@ def setup_auth(app: web.Application, gateway_app: Any = None) -> None:
                 if len(fernet_key) != 32:
                     raise ValueError("Key length invalid")
             except (ValueError, binascii.Error):
-                fernet_key = os.urandom(32)
+                fernet_key = _get_fallback_session_key()
                 enc = base64.b64encode(fernet_key).decode("utf-8")
                 gateway_app.web_config["session_secret_key"] = enc
         else:
-            fernet_key = os.urandom(32)
+            fernet_key = _get_fallback_session_key()
             if gateway_app and gateway_app.web_config is not None:
                 enc = base64.b64encode(fernet_key).decode("utf-8")
                 gateway_app.web_config["session_secret_key"] = enc
@@ -63,10 +76,23 @@ def verify_password(password: str, hashed: bytes) -> bool:
     """Verify a given password against a hashed one."""
     try:
         return bool(bcrypt.checkpw(password.encode("utf-8"), hashed))
-    except Exception:
+    except (ValueError, TypeError):
+        # Malformed or non-bytes hashes never match
         return False
 
 
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt in a worker thread.
+
+    A bcrypt round takes long enough to stall the event loop, which the web UI
+    shares with MQTT processing.
+    """
+    hashed = await asyncio.to_thread(
+        bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt()
+    )
+    return hashed.decode("utf-8")
+
+
 def is_valid_superuser_password(password: str, gateway_app: Any) -> bool:
     """Check if a password matches the superuser password from any source."""
     # 0. Database hash check (Primary: persisted changed password)
@@ -0,0 +1,31 @@
+"""Middlewares for the Web UI."""
+
+from typing import Awaitable, Callable
+
+from aiohttp import web
+
+# Only API payloads are compressed. HTML pages embed the CSRF token next to
+# reflected query values, which compression would expose to BREACH-style
+# attacks.
+COMPRESSIBLE_CONTENT_TYPES = frozenset({"application/json", "text/plain"})
+# Bodies smaller than this gain nothing from compression
+COMPRESS_MIN_SIZE = 512
+
+
+@web.middleware
+async def compression_middleware(
+    request: web.Request,
+    handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+) -> web.StreamResponse:
+    """Compress large API responses when the client accepts it."""
+    response = await handler(request)
+    if (
+        isinstance(response, web.Response)
+        and response.content_type in COMPRESSIBLE_CONTENT_TYPES
+        and isinstance(response.body, bytes)
+        and len(response.body) >= COMPRESS_MIN_SIZE
+    ):
+        # The coding is negotiated from Accept-Encoding when the response starts
+        response.enable_compression()
+        response.headers.setdefault("Vary", "Accept-Encoding")
+    return response
@@ -1,18 +1,19 @@
 """View handlers for the Web UI."""
 
 import asyncio
-import collections
+import functools
+import json
 import logging
 import os
 from typing import Any, Dict
 
 import aiohttp_jinja2
-import bcrypt
 from aiohttp import web
 from aiohttp_session import get_session
 
 from .auth import (
     generate_csrf,
+    hash_password,
     is_valid_superuser_password,
     login_required,
     validate_csrf,
@@ -20,6 +21,52 @@ from .auth import (
 )
 from .keys import GATEWAY_APP_KEY
 
+# Number of trailing log lines shown by the status page and /api/logs
+LOG_TAIL_LINES = 100
+# Block size used when reading the log file backwards from its end
+_LOG_TAIL_CHUNK_SIZE = 64 * 1024
+
+# The restart acknowledgement never varies, so serialize it once at import
+_RESTART_RESPONSE_BODY = json.dumps(
+    {"status": "success", "message": "Restarting..."}
+).encode("utf-8")
+
+
+def _read_log_tail(path: str, count: int = LOG_TAIL_LINES) -> str:
+    """Return the last ``count`` lines of a log file.
+
+    The file is read backwards from its end in fixed-size blocks until enough
+    line breaks have been seen, so the cost depends on the size of the tail
+    rather than on the size of the whole log.
+    """
+    chunks = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # One extra line break guarantees the first, possibly partial, line
+        # falls outside the slice taken below.
+        while pos > 0 and newlines <= count:
+            size = min(_LOG_TAIL_CHUNK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    chunks.reverse()
+    lines = b"".join(chunks).splitlines(keepends=True)[-count:]
+    return b"".join(lines).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _read_log_tail_cached(path: str, etag: str) -> str:
+    """Return the log tail for ``path``, reused while its ETag is unchanged.
+
+    Several sessions polling /api/logs between two writes to the log then share
+    one read of the file instead of each reading it again.
+    """
+    return _read_log_tail(path)
+
 
 async def get_common_context(request: web.Request, **kwargs: Any) -> Dict[str, Any]:
     """Helper to build common template context for all pages."""
@@ -58,6 +105,16 @@ async def login_get(request: web.Request) -> Dict[str, Any]:
     return await get_common_context(request)
 
 
+async def _start_session(request: web.Request, username: str, role: str) -> None:
+    """Mark the request's session as logged in for the given user and role."""
+    session = await get_session(request)
+    # Every assignment flags the session as changed and forces a new encrypted
+    # cookie, so only write the values that actually differ.
+    for key, value in (("logged_in", True), ("username", username), ("role", role)):
+        if session.get(key) != value:
+            session[key] = value
+
+
 @aiohttp_jinja2.template("login.html")
 async def login_post(request: web.Request) -> Dict[str, Any]:
     """Handle POST requests for the login page."""
@@ -77,24 +134,22 @@ async def login_post(request: web.Request) -> Dict[str, Any]:
     gateway_app = request.app[GATEWAY_APP_KEY]
     multi_tenant = gateway_app.config.web.multi_tenant_enabled
 
-    # 1. Check if the password corresponds to a superuser
-    is_super_user = is_valid_superuser_password(password, gateway_app)
-
+    # bcrypt checks take a noticeable amount of CPU, so they run in a worker
+    # thread instead of stalling MQTT processing on the event loop.
     if multi_tenant:
-        if username == "admin" and is_super_user:
-            session = await get_session(request)
-            session["logged_in"] = True
-            session["username"] = "admin"
-            session["role"] = "super_user"
+        # Only the admin account is checked against the superuser password
+        if username == "admin" and await asyncio.to_thread(
+            is_valid_superuser_password, password, gateway_app
+        ):
+            await _start_session(request, "admin", "super_user")
             raise web.HTTPFound("/status")
-        elif username and username in gateway_app.tenants_db:
-            tenant = gateway_app.tenants_db[username]
-            if "password_hash" in tenant:
-                if verify_password(password, tenant["password_hash"].encode("utf-8")):
-                    session = await get_session(request)
-                    session["logged_in"] = True
-                    session["username"] = username
-                    session["role"] = "tenant"
+        elif username:
+            tenant = gateway_app.tenants_db.get(username)
+            if tenant and "password_hash" in tenant:
+                if await asyncio.to_thread(
+                    verify_password, password, tenant["password_hash"].encode("utf-8")
+                ):
+                    await _start_session(request, username, "tenant")
                     raise web.HTTPFound("/status")
         return {
             "error": "Invalid credentials",
@@ -102,11 +157,8 @@ async def login_post(request: web.Request) -> Dict[str, Any]:
             "multi_tenant": True,
         }
     else:
-        if is_super_user:
-            session = await get_session(request)
-            session["logged_in"] = True
-            session["username"] = "admin"
-            session["role"] = "super_user"
+        if await asyncio.to_thread(is_valid_superuser_password, password, gateway_app):
+            await _start_session(request, "admin", "super_user")
             raise web.HTTPFound("/status")
 
     return await get_common_context(request, error="Invalid password")
@@ -232,14 +284,13 @@ async def config_post(request: web.Request) -> web.Response:
 
     if role == "tenant":
         # Save tenant config
-        tenant_db = dict(gateway_app.tenants_db.get(username, {}))
+        stored_tenant_db = gateway_app.tenants_db.get(username, {})
+        tenant_db = dict(stored_tenant_db)
 
         # Handle password change
         new_password = str(data.get("new_password", "")).strip()
         if new_password:
-            salt = bcrypt.gensalt()
-            hashed_bytes = bcrypt.hashpw(new_password.encode("utf-8"), salt)
-            tenant_db["password_hash"] = hashed_bytes.decode("utf-8")
+            tenant_db["password_hash"] = await hash_password(new_password)
 
         connect_key = str(data.get("caltopo_connect_key", "")).strip()
         if connect_key:
@@ -261,6 +312,10 @@ async def config_post(request: web.Request) -> web.Response:
                 nodes_dict[nid] = {"device_id": did, "group": ngrp if ngrp else None}
         tenant_db["nodes"] = nodes_dict
 
+        # A resubmitted form with nothing changed needs no write or restart
+        if tenant_db == stored_tenant_db:
+            raise web.HTTPFound("/config?success=1")
+
         # Save changes explicitly if persistentdict requires it
         gateway_app.tenants_db[username] = tenant_db
     else:
@@ -270,10 +325,8 @@ async def config_post(request: web.Request) -> web.Response:
                 new_username = str(data.get("new_tenant_username", "")).strip()
                 new_password = str(data.get("new_tenant_password", "")).strip()
                 if new_username and new_password:
-                    salt = bcrypt.gensalt()
-                    hashed_bytes = bcrypt.hashpw(new_password.encode("utf-8"), salt)
                     gateway_app.tenants_db[new_username] = {
-                        "password_hash": hashed_bytes.decode("utf-8"),
+                        "password_hash": await hash_password(new_password),
                         "nodes": {},
                         "caltopo_group": "",
                         "caltopo_connect_key": "",
@@ -286,7 +339,9 @@ async def config_post(request: web.Request) -> web.Response:
                 target_tenant = str(data.get("target_tenant", "")).strip()
 
                 # Security check: verify admin password
-                is_valid = is_valid_superuser_password(admin_password, gateway_app)
+                is_valid = await asyncio.to_thread(
+                    is_valid_superuser_password, admin_password, gateway_app
+                )
 
                 if (
                     is_valid
@@ -403,9 +458,7 @@ async def config_post(request: web.Request) -> web.Response:
             data.get("new_password", data.get("admin_password", ""))
         ).strip()
         if new_password:
-            salt = bcrypt.gensalt()
-            hashed_bytes = bcrypt.hashpw(new_password.encode("utf-8"), salt)
-            db["admin_password_hash"] = hashed_bytes.decode("utf-8")
+            db["admin_password_hash"] = await hash_password(new_password)
 
     # Update the multiple groups json.
 
@@ -444,29 +497,55 @@ async def restart_post(request: web.Request) -> web.Response:
 
     asyncio.create_task(delayed_stop())
 
-    return web.json_response({"status": "success", "message": "Restarting..."})
+    return web.Response(body=_RESTART_RESPONSE_BODY, content_type="application/json")
 
 
 @login_required
 async def api_logs_get(request: web.Request) -> web.Response:
-    """Handle GET requests for just the system logs."""
+    """Handle GET requests for just the system logs.
+
+    The response carries an ETag derived from the log file's modification time
+    and size, so the status page's polling gets a 304 without the file being
+    read again while nothing has been logged.
+    """
 
     gateway_app = request.app[GATEWAY_APP_KEY]
     log_content = "No logs available."
+    etag = None
 
     log_path = gateway_app.config.logging.file.path
     if log_path:
         try:
-            if os.path.exists(log_path):
-                with open(log_path, "r", encoding="utf-8") as f:
-                    deque = collections.deque(f, 100)
-                    log_content = "".join(deque)
-        except Exception:
+            stat = os.stat(log_path)
+        except FileNotFoundError:
+            stat = None
+        except OSError:
             logging.exception("Error reading logs from %s", log_path)
+            stat = None
             log_content = "Error reading logs."
 
+        if stat is not None:
+            etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+            if request.if_none_match and any(
+                tag.value == etag for tag in request.if_none_match
+            ):
+                raise web.HTTPNotModified(
+                    headers={"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+                )
+            try:
+                log_content = _read_log_tail_cached(log_path, etag)
+            except Exception:
+                logging.exception("Error reading logs from %s", log_path)
+                log_content = "Error reading logs."
+                etag = None
+
     # Return as plain text
-    return web.Response(text=log_content, content_type="text/plain")
+    response = web.Response(text=log_content, content_type="text/plain")
+    if etag is not None:
+        response.etag = etag
+        # Revalidate on every poll instead of reusing a cached copy blindly
+        response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @login_required
@@ -476,17 +555,21 @@ async def status_get(request: web.Request) -> Dict[str, Any]:
 
     gateway_app = request.app[GATEWAY_APP_KEY]
 
-    # Read last 100 lines of log
-    log_lines = []
+    # Read the tail of the log
+    logs = ""
     log_path = gateway_app.config.logging.file.path
     if log_path and os.path.exists(log_path):
         try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                deque = collections.deque(f, 100)
-                log_lines = list(deque)
+            logs = _read_log_tail(log_path)
         except Exception:
             logging.exception("Error reading logs for status page from %s", log_path)
 
+    # Resolve the per-render constants once rather than for every device
+    multi_tenant = gateway_app.config.web.multi_tenant_enabled
+    resolve_callsign = (
+        None if multi_tenant else getattr(gateway_app, "_get_or_create_callsign", None)
+    )
+
     # Inject configured names and tenant names if available
     display_states = {}
     for hw_id, state in gateway_app.device_states.items():
@@ -495,7 +578,7 @@ async def status_get(request: web.Request) -> Dict[str, Any]:
         tenant_name = None
 
         # Check multi-tenant configured nodes first
-        if gateway_app.config.web.multi_tenant_enabled:
+        if multi_tenant:
             matches = gateway_app._get_tenant_node_configs(hw_id)
             if matches:
                 # Use the first match for display purposes
@@ -504,9 +587,8 @@ async def status_get(request: web.Request) -> Dict[str, Any]:
                 tenant_name = match["tenant_name"]
 
         # Check single-tenant global config
-        if not callsign and hasattr(gateway_app, "_get_or_create_callsign"):
-            if not gateway_app.config.web.multi_tenant_enabled:
-                callsign = gateway_app._get_or_create_callsign(hw_id)
+        if not callsign and resolve_callsign is not None:
+            callsign = resolve_callsign(hw_id)
 
         display_state["configured_name"] = callsign
         display_state["tenant_name"] = tenant_name
@@ -547,8 +629,8 @@ async def status_get(request: web.Request) -> Dict[str, Any]:
     return {
         "stats": stats_to_display,
         "device_states": final_display_states,
-        "logs": "".join(log_lines),
-        "multi_tenant": gateway_app.config.web.multi_tenant_enabled,
+        "logs": logs,
+        "multi_tenant": multi_tenant,
         "role": role,
         "username": username,
         "csrf_token": await generate_csrf(request),
@@ -587,10 +669,8 @@ async def admin_panel_post(request: web.Request) -> web.Response:
     new_username = str(data.get("new_username", "")).strip()
     new_password = str(data.get("new_password", "")).strip()
     if new_username and new_password:
-        salt = bcrypt.gensalt()
-        hashed_bytes = bcrypt.hashpw(new_password.encode("utf-8"), salt)
         gateway_app.tenants_db[new_username] = {
-            "password_hash": hashed_bytes.decode("utf-8"),
+            "password_hash": await hash_password(new_password),
             "caltopo_connect_key": str(data.get("new_caltopo_key", "")).strip(),
             "caltopo_group": str(data.get("new_caltopo_group", "")).strip(),
             "nodes": {},
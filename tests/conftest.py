@@ -4,18 +4,12 @@ pytest configuration for MeshTopo Gateway Service tests.
 This file configures pytest to work with the project's test structure.
 """
 
-import sys
-from pathlib import Path
+import os
+import warnings
 from typing import Any, List
 
-# Add project root and tests directory to Python path
-PROJECT_ROOT = Path(__file__).parent.parent
-TESTS_DIR = Path(__file__).parent
-
-# Add paths to sys.path for imports
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-sys.path.insert(0, str(TESTS_DIR))
+# Import paths (tests/, src/ and the project root) are set by ``pythonpath``
+# in pyproject.toml's [tool.pytest.ini_options].
 
 
 # Configure pytest
@@ -27,6 +21,32 @@ def pytest_configure(config: Any) -> None:
     )
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
 
+    _preload_test_dependencies()
+
+
+def _preload_test_dependencies() -> None:
+    """Import heavy dependencies up front so the first test isn't billed for them.
+
+    Also reports a PyYAML built without libyaml, which makes every config
+    load in the suite several times slower. Set MESHTOPO_REQUIRE_LIBYAML=1
+    to turn the warning into an error (e.g. in CI).
+    """
+    import yaml
+
+    if not getattr(yaml, "__with_libyaml__", False):
+        message = (
+            "PyYAML is not using libyaml; install libyaml-dev and reinstall "
+            "PyYAML for faster tests"
+        )
+        if os.environ.get("MESHTOPO_REQUIRE_LIBYAML"):
+            raise RuntimeError(message)
+        warnings.warn(message, stacklevel=2)
+
+    import aiomqtt  # noqa: F401
+    import httpx  # noqa: F401
+
+    import src.web  # noqa: F401
+
 
 def pytest_collection_modifyitems(config: Any, items: List[Any]) -> None:
     """Modify test collection to add markers or other modifications."""
@@ -1,66 +1,72 @@
 import json
 import logging
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Type
-from urllib.parse import parse_qs, urlparse
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from typing import Optional, Type
+from urllib.parse import parse_qsl, urlparse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 RECEIVED_REPORTS = []
+# Requests are served from several threads at once
+REPORTS_LOCK = threading.Lock()
 
 
 class MockHandler(BaseHTTPRequestHandler):
+    # Keep connections open so clients can reuse them between requests
+    protocol_version = "HTTP/1.1"
+
+    def _send(
+        self, status: int, body: bytes = b"", content_type: Optional[str] = None
+    ) -> None:
+        """Send a complete response with an explicit Content-Length."""
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self) -> None:
+        content_length = int(self.headers.get("Content-Length", 0))
+        post_data = self.rfile.read(content_length)
         if self.path.endswith("/position/report"):
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
             try:
                 data = json.loads(post_data.decode("utf-8"))
                 logger.info(f"Received report: {data}")
-                RECEIVED_REPORTS.append(data)
-                self.send_response(200)
-                self.end_headers()
-                self.wfile.write(b"OK")
+                with REPORTS_LOCK:
+                    RECEIVED_REPORTS.append(data)
+                self._send(200, b"OK")
             except json.JSONDecodeError:
-                self.send_response(400)
-                self.end_headers()
-                self.wfile.write(b"Invalid JSON")
+                self._send(400, b"Invalid JSON")
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send(404)
 
     def do_GET(self) -> None:
         if self.path == "/reports":
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(RECEIVED_REPORTS).encode("utf-8"))
+            with REPORTS_LOCK:
+                body = json.dumps(RECEIVED_REPORTS).encode("utf-8")
+            self._send(200, body, "application/json")
         elif self.path == "/clear":
-            RECEIVED_REPORTS.clear()
-            self.send_response(200)
-            self.end_headers()
-            self.wfile.write(b"Cleared")
+            with REPORTS_LOCK:
+                RECEIVED_REPORTS.clear()
+            self._send(200, b"Cleared")
         elif "/api/v1/position/report" in self.path:
-            # Parse query params
+            # Parse query params; position reports never repeat a key
             parsed_url = urlparse(self.path)
-            params = parse_qs(parsed_url.query)
-
-            # Convert to dict where values are single items if possible
-            report_data = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
+            report_data = dict(parse_qsl(parsed_url.query))
             logger.info(f"Received report via GET: {report_data}")
 
-            RECEIVED_REPORTS.append(report_data)
-            self.send_response(200)
-            self.end_headers()
-            self.wfile.write(b"OK")
+            with REPORTS_LOCK:
+                RECEIVED_REPORTS.append(report_data)
+            self._send(200, b"OK")
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send(404)
 
 
 def run(
-    server_class: Type[HTTPServer] = HTTPServer,
+    server_class: Type[HTTPServer] = ThreadingHTTPServer,
     handler_class: Type[BaseHTTPRequestHandler] = MockHandler,
     port: int = 8080,
 ) -> None:
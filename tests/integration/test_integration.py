@@ -6,6 +6,7 @@ import time
 import httpx
 import pytest
 from paho.mqtt import client as mqtt
+from paho.mqtt import publish as mqtt_publish
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +17,9 @@ MQTT_BROKER = "localhost"
 MQTT_PORT = 1883
 MOCK_SERVER_URL = "http://localhost:8080"
 TEST_TOPIC = "msh/US/2/json/TestNode/!1234abcd"
+# Readiness polling starts fast and backs off so slow starts don't spin
+POLL_INITIAL_DELAY = 0.01
+POLL_MAX_DELAY = 0.5
 # Protobuf payload
 # JSON payload (Gateway expects JSON)
 TEST_MESSAGE_DICT = {
@@ -30,22 +34,29 @@ TEST_MESSAGE_DICT = {
     },
 }
 TEST_MESSAGE = json.dumps(TEST_MESSAGE_DICT)
+# Number of position updates sent by the bulk publish test
+BULK_MESSAGE_COUNT = 50
+# The stack's config (config.yaml.example plus .env.integration) sets both a
+# connect key and a group, so every position is reported to two endpoints
+REPORTS_PER_MESSAGE = 2
 
 
-def wait_for_services(timeout=60):
+def wait_for_services(http_client, timeout=60):
     """
     Wait for services to be ready by polling health endpoints.
 
     Args:
+        http_client: Client for the mock server
         timeout: Maximum seconds to wait for services
     """
     start_time = time.time()
 
     # Wait for mock server
     logger.info("Waiting for mock server to be ready...")
+    delay = POLL_INITIAL_DELAY
     while time.time() - start_time < timeout:
         try:
-            response = httpx.get(f"{MOCK_SERVER_URL}/reports", timeout=2.0)
+            response = http_client.get("/reports", timeout=2.0)
             if response.status_code == 200:
                 logger.info("Mock server is ready")
                 break
@@ -55,21 +66,25 @@ def wait_for_services(timeout=60):
             httpx.ReadError,
             httpx.RemoteProtocolError,
         ):
-            time.sleep(0.5)
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
     else:
         raise TimeoutError("Mock server did not become ready in time")
 
     # Wait for MQTT broker
     logger.info("Waiting for MQTT broker to be ready...")
+    test_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, "health_check")
+    delay = POLL_INITIAL_DELAY
     while time.time() - start_time < timeout:
         try:
-            test_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, "health_check")
             test_client.connect(MQTT_BROKER, MQTT_PORT, 60)
             test_client.disconnect()
             logger.info("MQTT broker is ready")
             break
         except Exception:
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
     else:
         raise TimeoutError("MQTT broker did not become ready in time")
 
@@ -79,7 +94,14 @@ def wait_for_services(timeout=60):
 
 
 @pytest.fixture(scope="module")
-def docker_stack():
+def http_client():
+    """One client for all mock server requests, so its connection is reused."""
+    with httpx.Client(base_url=MOCK_SERVER_URL, timeout=5.0) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def docker_stack(http_client):
     """Fixture to spin up and tear down the integration test stack."""
     subprocess.run(
         [
@@ -109,7 +131,7 @@ def docker_stack():
 
     # Wait for services to be ready
     logger.info("Waiting for services to initialize...")
-    wait_for_services()
+    wait_for_services(http_client)
 
     yield
 
@@ -139,8 +161,47 @@ def docker_stack():
     )
 
 
+@pytest.fixture(scope="module")
+def mqtt_publisher(docker_stack):
+    """Connected MQTT client with a running network loop, shared by the tests."""
+
+    def on_connect(client, userdata, flags, reason_code, properties):
+        if reason_code.is_failure:
+            logger.error(f"Failed to connect: {reason_code}")
+            return
+        logger.info("Connected to MQTT Broker!")
+
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, "integration_test_publisher")
+    client.on_connect = on_connect
+    logger.info(f"Connecting to MQTT broker at {MQTT_BROKER}:{MQTT_PORT}...")
+    client.connect(MQTT_BROKER, MQTT_PORT)
+    client.loop_start()
+    yield client
+    client.disconnect()
+    client.loop_stop()
+
+
+def _poll_reports(http_client, minimum, timeout=15):
+    """Poll the mock server until it holds at least ``minimum`` reports."""
+    start_time = time.time()
+    reports = []
+    delay = POLL_INITIAL_DELAY
+    while time.time() - start_time < timeout:
+        try:
+            response = http_client.get("/reports", timeout=1.0)
+            if response.status_code == 200:
+                reports = response.json()
+                if len(reports) >= minimum:
+                    break
+        except Exception:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+    return reports
+
+
 @pytest.mark.integration
-def test_end_to_end_flow(docker_stack):
+def test_end_to_end_flow(docker_stack, http_client, mqtt_publisher):
     """
     Test the full flow:
     1. Publish MQTT message
@@ -151,7 +212,7 @@ def test_end_to_end_flow(docker_stack):
     # 1. Clear previous reports
     logger.info("Clearing mock server reports...")
     try:
-        httpx.get(f"{MOCK_SERVER_URL}/clear", timeout=5.0)
+        http_client.get("/clear")
     except httpx.ConnectError:
         pytest.fail("Could not connect to mock server. Is it running?")
     except httpx.TimeoutException:
@@ -159,27 +220,10 @@ def test_end_to_end_flow(docker_stack):
 
     # 2. Publish MQTT Message
     logger.info(f"Publishing message to {TEST_TOPIC}...")
-
-    def on_connect(client, userdata, flags, reason_code, properties):
-        if reason_code.is_failure:
-            logger.error(f"Failed to connect: {reason_code}")
-            return
-        logger.info("Connected to MQTT Broker!")
-
-    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, "integration_test_publisher")
-    client.on_connect = on_connect
-
     try:
-        logger.info(f"Connecting to MQTT broker at {MQTT_BROKER}:{MQTT_PORT}...")
-        client.connect(MQTT_BROKER, MQTT_PORT)
-        logger.info("Publishing message...")
-        msg_info = client.publish(TEST_TOPIC, TEST_MESSAGE)
+        # QoS 1 so the broker's PUBACK confirms delivery instead of a fixed sleep
+        msg_info = mqtt_publisher.publish(TEST_TOPIC, TEST_MESSAGE, qos=1)
         msg_info.wait_for_publish(timeout=5)
-        client.loop_start()
-        logger.info("Waiting for message processing...")
-        # Reduce fixed sleep, rely on polling validation
-        time.sleep(1)
-        client.loop_stop()
         logger.info("MQTT publish complete.")
     except Exception as e:
         pytest.fail(f"MQTT Publish failed: {e}")
@@ -188,21 +232,7 @@ def test_end_to_end_flow(docker_stack):
     logger.info("Verifying report reception...")
 
     # Poll for reports with timeout
-    start_time = time.time()
-    timeout = 15
-    reports = []
-
-    while time.time() - start_time < timeout:
-        try:
-            response = httpx.get(f"{MOCK_SERVER_URL}/reports", timeout=1.0)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    reports = data
-                    break
-        except Exception:
-            pass
-        time.sleep(0.5)
+    reports = _poll_reports(http_client, 1)
 
     try:
         assert len(reports) > 0, "No reports received by mock server within timeout"
@@ -218,3 +248,40 @@ def test_end_to_end_flow(docker_stack):
 
     except Exception as e:
         pytest.fail(f"Verification failed: {e}")
+
+
+@pytest.mark.integration
+def test_bulk_publish_flow(docker_stack, http_client):
+    """
+    Publish a batch of position updates over a single MQTT connection and
+    verify the gateway forwards them to the mock server.
+    """
+    http_client.get("/clear")
+
+    msgs = []
+    for i in range(BULK_MESSAGE_COUNT):
+        message = dict(TEST_MESSAGE_DICT)
+        message["payload"] = dict(TEST_MESSAGE_DICT["payload"], time=1600000000 + i)
+        msgs.append({"topic": TEST_TOPIC, "payload": json.dumps(message), "qos": 1})
+
+    # One CONNECT for the whole batch; multiple() returns once every QoS 1
+    # message has been acknowledged by the broker
+    logger.info(f"Publishing {BULK_MESSAGE_COUNT} messages to {TEST_TOPIC}...")
+    try:
+        mqtt_publish.multiple(
+            msgs,
+            hostname=MQTT_BROKER,
+            port=MQTT_PORT,
+            client_id="integration_bulk",
+        )
+    except Exception as e:
+        pytest.fail(f"MQTT bulk publish failed: {e}")
+
+    expected = BULK_MESSAGE_COUNT * REPORTS_PER_MESSAGE
+    reports = _poll_reports(http_client, expected)
+    logger.info(f"Received {len(reports)} reports for {BULK_MESSAGE_COUNT} messages")
+    # The gateway forwards every non-retained position message to each
+    # configured endpoint, so the count is exact
+    assert (
+        len(reports) == expected
+    ), f"Expected {expected} reports, got {len(reports)} within timeout"
@@ -2,13 +2,16 @@
 """
 Test runner for MeshTopo Gateway Service.
 
-This script runs all tests in the tests directory.
+This script runs all unit tests in the tests directory with pytest, spreading
+them across CPUs when pytest-xdist is installed.
 """
 
+import importlib.util
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -16,19 +19,13 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 def run_tests() -> int:
     """Run all tests."""
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = str(PROJECT_ROOT)
-    suite = loader.discover(
-        start_dir, pattern="test_*.py", top_level_dir=str(PROJECT_ROOT)
-    )
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    args = [str(PROJECT_ROOT), "-m", "not integration", "--tb=short"]
+    # Parallelize only when the plugin is available; it is not a dependency
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto"]
 
     # Return exit code
-    return 0 if result.wasSuccessful() else 1
+    return int(pytest.main(args))
 
 
 if __name__ == "__main__":
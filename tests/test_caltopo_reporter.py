@@ -56,6 +56,23 @@ def test_validate_and_log_identifier(reporter):
         mock_log.assert_called_once()
 
 
+def test_endpoint_url_validates_once(reporter):
+    with patch.object(
+        reporter,
+        "_is_valid_caltopo_identifier",
+        wraps=reporter._is_valid_caltopo_identifier,
+    ) as mock_valid:
+        url = reporter._endpoint_url("valid_key", "connect_key")
+        assert url == f"{reporter.BASE_URL}/valid_key"
+        assert reporter._endpoint_url("valid_key", "connect_key") == url
+        mock_valid.assert_called_once_with("valid_key")
+
+        # Invalid identifiers are rejected and checked again every time
+        assert reporter._endpoint_url("in valid", "group") is None
+        assert reporter._endpoint_url("in valid", "group") is None
+        assert mock_valid.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_send_to_connect_key_success(reporter, mock_client):
     reporter.config.caltopo.connect_key = "secret_key"
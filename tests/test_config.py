@@ -7,41 +7,51 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Optional
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
-def create_test_config() -> str:
-    """Create a temporary test configuration file."""
-    config_content = """
-mqtt:
-    broker: localhost
-    port: 1883
-    username: ''
-    password: ''
-    topic: "msh/REGION/2/json/+/+"
-
-caltopo:
-    connect_key: TEST_CONNECT_KEY
-
-nodes:
-    '!test123':
-        device_id: TEST-DEVICE
-
-logging:
-    level: INFO
-    file:
-        enabled: true
-        path: test.log
-        max_size: 10MB
-        backup_count: 5
-"""
+def create_test_config(path: Optional[str] = None) -> str:
+    """Create a test configuration file, temporary unless ``path`` is given."""
+    config_data = {
+        "mqtt": {
+            "broker": "localhost",
+            "port": 1883,
+            "username": "",
+            "password": "",
+            "topic": "msh/REGION/2/json/+/+",
+        },
+        "caltopo": {"connect_key": "TEST_CONNECT_KEY"},
+        "nodes": {"!test123": {"device_id": "TEST-DEVICE"}},
+        "logging": {
+            "level": "INFO",
+            "file": {
+                "enabled": True,
+                "path": "test.log",
+                "max_size": "10MB",
+                "backup_count": 5,
+            },
+        },
+    }
+
+    if path is not None:
+        with open(path, "w") as f:
+            yaml.dump(config_data, f, Dumper=_YamlDumper)
+        return path
 
     # Create temporary file
     temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
-    temp_file.write(config_content)
+    yaml.dump(config_data, temp_file, Dumper=_YamlDumper)
     temp_file.close()
 
     return temp_file.name
@@ -58,13 +68,21 @@ def cleanup_test_config(config_path: str) -> None:
 class TestCase(unittest.TestCase):
     """Base test case with common utilities."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one temporary directory shared by the class's tests."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.test_config_path = os.path.join(cls._tmpdir.name, "config.yaml")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared temporary directory."""
+        cls._tmpdir.cleanup()
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.test_config_path = create_test_config()
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        cleanup_test_config(self.test_config_path)
+        # Rewritten per test because some tests append to the file
+        create_test_config(self.test_config_path)
 
 
 class TestConfig(TestCase):
@@ -1,3 +1,4 @@
+import io
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -43,24 +44,47 @@ class TestConfigMethods:
 
     def test_from_file_yaml_error(self):
         """Test loading config with invalid YAML."""
-        with (
-            patch("builtins.open", mock_open(read_data="invalid: yaml: :")),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
+        with patch("builtins.open", mock_open(read_data="invalid: yaml: :")):
 
             with pytest.raises(yaml.YAMLError):
                 Config.from_file("config.yaml")
 
+    def test_from_file_missing(self, tmp_path):
+        """Test loading a config file that does not exist."""
+        missing = tmp_path / "missing.yaml"
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            Config.from_file(str(missing))
+
+    def test_from_file_utf8(self, tmp_path):
+        """Test non-ASCII values survive the binary-mode load."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "mqtt:\n  broker: localhost\n"
+            "caltopo:\n  connect_key: key\n"
+            "logging:\n  level: INFO\n"
+            "nodes:\n  '!1234':\n    device_id: CAFÉ-1\n",
+            encoding="utf-8",
+        )
+        config = Config.from_file(str(config_path))
+        assert config.get_node_device_id("!1234") == "CAFÉ-1"
+
     def test_from_file_type_error(self):
         """Test loading config that is a list, not a dict."""
-        with (
-            patch("builtins.open", mock_open(read_data="- list item\n- another item")),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
+        with patch("builtins.open", mock_open(read_data="- list item\n- another item")):
 
             with pytest.raises(TypeError, match="must be a dictionary"):
                 Config.from_file("config.yaml")
 
+    def test_from_stream_text(self):
+        """Test loading config from an in-memory text stream."""
+        stream = io.StringIO(
+            "mqtt:\n  broker: localhost\n"
+            "caltopo:\n  group: grp\n"
+            "logging:\n  level: INFO\n"
+        )
+        config = Config.from_stream(stream)
+        assert config.caltopo.group == "grp"
+
     def test_get_node_device_id_robustness(self):
         """Test robust node ID lookup (handling optional '!')."""
         config = Config(
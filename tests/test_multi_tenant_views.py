@@ -182,6 +182,31 @@ async def test_tenant_config_post(cli_multi, mock_gateway_app_multi):
         assert tenant_cfg["nodes"]["!newhw"]["device_id"] == "NEWALIAS"
 
 
+@pytest.mark.asyncio
+async def test_tenant_config_post_unchanged(cli_multi, mock_gateway_app_multi):
+    """Test resubmitting an unchanged tenant form skips the save and restart."""
+    tenant_cfg = mock_gateway_app_multi.tenants_db["tenant1"]
+    tenant_cfg["caltopo_group"] = "T1-GROUP"
+    mock_gateway_app_multi.restart_requested = False
+    with patch("src.web.views.validate_csrf", return_value=True):
+        await cli_multi.post(
+            "/login", data={"username": "tenant1", "password": "tenant_pass"}
+        )
+    with patch("src.web.views.validate_csrf", return_value=True):
+        data = {
+            "caltopo_group": "T1-GROUP",
+            "node_id[]": ["!12345678"],
+            "node_device_id[]": ["T1-NODE"],
+            "node_group[]": ["T1-GROUP"],
+        }
+        resp = await cli_multi.post("/config", data=data, allow_redirects=False)
+        assert resp.status == 302
+        assert resp.headers["Location"] == "/config?success=1"
+
+    assert mock_gateway_app_multi.tenants_db["tenant1"] is tenant_cfg
+    assert mock_gateway_app_multi.restart_requested is False
+
+
 @pytest.mark.asyncio
 async def test_tenant_change_password(cli_multi, mock_gateway_app_multi):
     """Test that a tenant can change their own password and then log in."""
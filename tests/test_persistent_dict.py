@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 
 import pytest
 
@@ -105,3 +106,132 @@ def test_invalid_json_in_db(db_path):
         # or JSONDecodeError
         with pytest.raises(KeyError):
             _ = pd["bad_key"]
+
+
+def test_connection_pragmas(db_path):
+    """Verify the performance pragmas are applied on connect"""
+    with PersistentDict(db_path) as pd:
+        conn = pd.conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+        # MEMORY == 2
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA journal_size_limit").fetchone()[0] == 67108864
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_close_is_idempotent(db_path):
+    pd = PersistentDict(db_path)
+    pd["k"] = "v"
+    pd.close()
+    pd.close()
+    assert pd.conn is None
+
+    with pytest.raises(RuntimeError):
+        _ = pd["k"]
+
+
+def test_contains_does_not_decode_value(db_path):
+    """Membership checks must not depend on the stored value being valid JSON"""
+    with PersistentDict(db_path, tablename="test") as pd:
+        pd.conn.execute(
+            "INSERT INTO test (key, value) VALUES (?, ?)", ("bad_key", "{invalid")
+        )
+        assert "bad_key" in pd
+        assert "missing" not in pd
+
+
+def test_iter_spans_multiple_batches(db_path):
+    with PersistentDict(db_path, autocommit=False) as pd:
+        keys = {f"k{i}" for i in range(5000)}
+        for k in keys:
+            pd[k] = 1
+        pd.conn.commit()
+
+        assert set(pd) == keys
+
+
+def test_get_many(db_path):
+    with PersistentDict(db_path) as pd:
+        for i in range(1000):
+            pd[f"k{i}"] = {"n": i}
+
+        keys = [f"k{i}" for i in range(0, 1000, 2)] + ["missing", "k0"]
+        result = pd.get_many(keys)
+
+        assert len(result) == 500
+        assert result["k998"] == {"n": 998}
+        assert "missing" not in result
+        assert pd.get_many([]) == {}
+
+
+def test_items_single_query(db_path):
+    with PersistentDict(db_path, tablename="test") as pd:
+        pd["a"] = 1
+        pd["b"] = [2]
+        pd.conn.execute(
+            "INSERT INTO test (key, value) VALUES (?, ?)", ("bad_key", "{invalid")
+        )
+
+        assert ("a", 1) in pd.items()
+        assert len(pd.items()) == 3
+        # A corrupted value raises, as it does through pd["bad_key"]
+        with pytest.raises(KeyError):
+            dict(pd.items())
+
+        del pd["bad_key"]
+        assert dict(pd.items()) == {"a": 1, "b": [2]}
+
+
+def test_value_column_is_blob(db_path):
+    with PersistentDict(db_path, tablename="blob_test") as pd:
+        columns = pd.conn.execute("PRAGMA table_info(blob_test)").fetchall()
+        assert {c[1]: c[2] for c in columns}["value"] == "BLOB"
+        schema = pd.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'blob_test'"
+        ).fetchone()[0]
+        assert schema.endswith("WITHOUT ROWID")
+
+        # Raw JSON bytes written by other tools still decode
+        pd.conn.execute(
+            "INSERT INTO blob_test (key, value) VALUES (?, ?)", ("raw", b'{"a": 1}')
+        )
+        assert pd["raw"] == {"a": 1}
+
+
+def test_per_thread_connections(db_path):
+    """Each thread reads through its own connection; close() releases them all"""
+    pd = PersistentDict(db_path)
+    pd["shared"] = {"v": 1}
+    main_conn = pd.conn
+
+    results = {}
+
+    def reader():
+        results["value"] = pd["shared"]
+        results["conn"] = pd.conn
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    thread.join()
+
+    assert results["value"] == {"v": 1}
+    assert results["conn"] is not main_conn
+    assert pd.conn is main_conn
+
+    pd.close()
+    assert pd.conn is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        results["conn"].execute("SELECT 1")
+
+
+def test_connect_after_close_is_not_registered(db_path):
+    """A connection opened while close() runs is closed rather than leaked"""
+    pd = PersistentDict(db_path)
+    pd.close()
+    # Simulates a thread that passed the _closed check just before close()
+    with pytest.raises(RuntimeError):
+        pd._connect()
+    assert pd._connections == {}
@@ -1,4 +1,4 @@
-from utils import sanitize_for_log
+from utils import _ESCAPE_TABLE, sanitize_for_log
 
 
 class TestSanitizeForLog:
@@ -33,3 +33,15 @@ class TestSanitizeForLog:
         sanitized = sanitize_for_log(attack)
         assert sanitized == "User logged in\\x0a[INFO] User became admin"
         assert "\n" not in sanitized
+
+    def test_sanitize_non_latin1_control_chars(self):
+        # Line/paragraph separators are escaped, other unicode passes through
+        assert sanitize_for_log("a\u2028b") == "a\\x2028b"
+        assert sanitize_for_log("café ✓") == "café ✓"
+
+    def test_escape_table_does_not_grow(self):
+        # Untrusted text must not be able to grow the translate table
+        size = len(_ESCAPE_TABLE)
+        text = "\n" + "".join(chr(c) for c in range(0x100, 0x3000))
+        assert sanitize_for_log(text).startswith("\\x0a")
+        assert len(_ESCAPE_TABLE) == size == 256
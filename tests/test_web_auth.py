@@ -66,6 +66,19 @@ def test_setup_auth_creates_new_key_if_none():
             assert "session_secret_key" in gateway_app.web_config
 
 
+def test_setup_auth_reuses_fallback_key():
+    """Test setup_auth generates the fallback key once per process."""
+    with (
+        patch.dict(os.environ, clear=True),
+        patch("src.web.auth._fallback_session_key", None),
+        patch("src.web.auth.os.urandom", return_value=b"k" * 32) as mock_urandom,
+    ):
+        with patch("src.web.auth.aiohttp_session.setup"):
+            setup_auth(web.Application())
+            setup_auth(web.Application())
+        mock_urandom.assert_called_once_with(32)
+
+
 @pytest.mark.asyncio
 async def test_login_required_decorator_logged_in():
     """Test login_required decorator passes if user is logged in."""
@@ -118,6 +131,19 @@ def test_verify_password():
     assert verify_password(password, hashed) is True
     assert verify_password("wrong_password", hashed) is False
     assert verify_password(password, b"invalid_hash") is False
+    assert verify_password(password, hashed.decode("utf-8")) is False
+
+
+@pytest.mark.asyncio
+async def test_hash_password():
+    """Test hash_password produces a bcrypt hash verify_password accepts."""
+    from src.web.auth import hash_password, verify_password
+
+    hashed = await hash_password("my_secret_password")
+
+    assert hashed.startswith("$2")
+    assert verify_password("my_secret_password", hashed.encode("utf-8")) is True
+    assert verify_password("wrong_password", hashed.encode("utf-8")) is False
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,6 @@
 """Tests for web UI views."""
 
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import pytest_asyncio
@@ -46,6 +46,26 @@ async def cli(mock_gateway_app):
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_create_app_shares_template_bytecode(mock_gateway_app):
+    """Test apps rebuilt on restart reuse compiled template code."""
+    import aiohttp_jinja2
+
+    first = aiohttp_jinja2.get_env(await create_app(mock_gateway_app))
+    second = aiohttp_jinja2.get_env(await create_app(mock_gateway_app))
+    assert first is not second
+    assert first.bytecode_cache is second.bytecode_cache
+
+    first.get_template("login.html")
+    with patch.object(
+        second.bytecode_cache,
+        "dump_bytecode",
+        wraps=second.bytecode_cache.dump_bytecode,
+    ) as dump:
+        second.get_template("login.html")
+    dump.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_index_unauthenticated(cli):
     """Test index redirects to login if unauthenticated."""
@@ -104,6 +124,18 @@ async def test_login_post_valid_config(cli):
     assert resp.headers["Location"] == "/status"
 
 
+@pytest.mark.asyncio
+async def test_login_post_repeat_keeps_cookie(cli):
+    """Test logging in again as the same user does not reissue the cookie."""
+    data = {"username": "admin", "password": "default_admin"}
+    first = await cli.post("/login", data=data, allow_redirects=False)
+    assert "AIOHTTP_SESSION" in first.cookies
+
+    second = await cli.post("/login", data=data, allow_redirects=False)
+    assert second.status == 302
+    assert "AIOHTTP_SESSION" not in second.cookies
+
+
 @pytest.mark.asyncio
 async def test_login_post_valid_db_hash(mock_gateway_app):
     """Test login post with db admin hash."""
@@ -215,30 +247,81 @@ async def test_restart_post(cli):
 
 
 @pytest.mark.asyncio
-async def test_api_logs_get(cli):
+async def test_api_logs_get(cli, mock_gateway_app, tmp_path):
     """Test api_logs_get API."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line 1\nlog line 2\n")
+    mock_gateway_app.config.logging.file.path = str(log_file)
     await cli.post("/login", data={"username": "admin", "password": "default_admin"})
 
-    with (
-        patch("src.web.views.os.path.exists", return_value=True),
-        patch("builtins.open", mock_open(read_data="log line 1\\nlog line 2")),
-    ):
-        resp = await cli.get("/api/logs")
-        assert resp.status == 200
-        text = await resp.text()
-        assert "log line 1" in text
-        assert "log line 2" in text
+    resp = await cli.get("/api/logs")
+    assert resp.status == 200
+    text = await resp.text()
+    assert "log line 1" in text
+    assert "log line 2" in text
+
+
+@pytest.mark.asyncio
+async def test_api_logs_get_not_modified(cli, mock_gateway_app, tmp_path):
+    """Test api_logs_get answers 304 until the log file changes."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line 1\n")
+    mock_gateway_app.config.logging.file.path = str(log_file)
+    await cli.post("/login", data={"username": "admin", "password": "default_admin"})
+
+    resp = await cli.get("/api/logs")
+    etag = resp.headers["ETag"]
+
+    resp = await cli.get("/api/logs", headers={"If-None-Match": etag})
+    assert resp.status == 304
+    assert await resp.read() == b""
+
+    with open(log_file, "a") as f:
+        f.write("log line 2\n")
+    resp = await cli.get("/api/logs", headers={"If-None-Match": etag})
+    assert resp.status == 200
+    assert "log line 2" in await resp.text()
+    assert resp.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_api_logs_get_reuses_tail(cli, mock_gateway_app, tmp_path):
+    """Test api_logs_get reads an unchanged log only once."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line 1\n")
+    mock_gateway_app.config.logging.file.path = str(log_file)
+    await cli.post("/login", data={"username": "admin", "password": "default_admin"})
+
+    with patch(
+        "src.web.views._read_log_tail", return_value="log line 1\n"
+    ) as read_tail:
+        for _ in range(3):
+            resp = await cli.get("/api/logs")
+            assert await resp.text() == "log line 1\n"
+    read_tail.assert_called_once_with(str(log_file))
 
 
 @pytest.mark.asyncio
-async def test_api_logs_get_exception(cli):
+async def test_api_logs_get_missing_file(cli, mock_gateway_app, tmp_path):
+    """Test api_logs_get when the log file does not exist yet."""
+    mock_gateway_app.config.logging.file.path = str(tmp_path / "missing.log")
+    await cli.post("/login", data={"username": "admin", "password": "default_admin"})
+
+    resp = await cli.get("/api/logs")
+    assert resp.status == 200
+    assert await resp.text() == "No logs available."
+    assert "ETag" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_api_logs_get_exception(cli, mock_gateway_app, tmp_path):
     """Test api_logs_get API on file read error."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line 1\n")
+    mock_gateway_app.config.logging.file.path = str(log_file)
     await cli.post("/login", data={"username": "admin", "password": "default_admin"})
 
-    with (
-        patch("src.web.views.os.path.exists", return_value=True),
-        patch("builtins.open", side_effect=PermissionError("denied")),
-    ):
+    with patch("builtins.open", side_effect=PermissionError("denied")):
         resp = await cli.get("/api/logs")
         assert resp.status == 200
         text = await resp.text()
@@ -246,18 +329,52 @@ async def test_api_logs_get_exception(cli):
 
 
 @pytest.mark.asyncio
-async def test_status_get(cli):
+async def test_api_logs_get_tail(cli, mock_gateway_app, tmp_path):
+    """Test api_logs_get returns only the last lines of a large log."""
+    log_file = tmp_path / "gateway.log"
+    # Spans several read blocks and ends without a trailing newline
+    log_file.write_text("\n".join(f"line {i} {'x' * 1000}" for i in range(500)))
+    mock_gateway_app.config.logging.file.path = str(log_file)
+    await cli.post("/login", data={"username": "admin", "password": "default_admin"})
+
+    resp = await cli.get("/api/logs")
+    lines = (await resp.text()).split("\n")
+    assert len(lines) == 100
+    assert lines[0].startswith("line 400 ")
+    assert lines[-1].startswith("line 499 ")
+
+
+@pytest.mark.asyncio
+async def test_api_logs_get_compressed(cli, mock_gateway_app, tmp_path):
+    """Test api_logs_get compresses large bodies but not small ones."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line\n" * 100)
+    mock_gateway_app.config.logging.file.path = str(log_file)
+    await cli.post("/login", data={"username": "admin", "password": "default_admin"})
+
+    resp = await cli.get("/api/logs", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.text() == "log line\n" * 100
+
+    log_file.write_text("log line\n")
+    resp = await cli.get("/api/logs", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == "log line\n"
+
+
+@pytest.mark.asyncio
+async def test_status_get(cli, mock_gateway_app, tmp_path):
     """Test status page GET."""
+    log_file = tmp_path / "gateway.log"
+    log_file.write_text("log line 1")
+    mock_gateway_app.config.logging.file.path = str(log_file)
     await cli.post("/login", data={"username": "admin", "password": "default_admin"})
 
-    with (
-        patch("src.web.views.os.path.exists", return_value=True),
-        patch("builtins.open", mock_open(read_data="log line 1")),
-    ):
-        resp = await cli.get("/status")
-        assert resp.status == 200
-        text = await resp.text()
-        assert "log line 1" in text
+    resp = await cli.get("/status")
+    assert resp.status == 200
+    text = await resp.text()
+    assert "log line 1" in text
 
 
 @pytest.mark.asyncio